@@ -0,0 +1,258 @@
+import asyncio
+import os
+import textwrap
+from typing import Any, Dict, List, Optional
+
+import httpx
+from openai import AsyncOpenAI
+
+from .llm_cache import ResponseCache
+
+# One client per provider for the whole process: each AsyncOpenAI /
+# AsyncAnthropic instance owns its own connection pool, so per-agent
+# clients pay TLS + TCP setup repeatedly instead of reusing warm
+# connections. HTTP/2 additionally multiplexes concurrent calls over a
+# single connection.
+_openai_client = None
+_anthropic_client = None
+
+_response_cache: Optional[ResponseCache] = None
+
+# Caps in-flight provider calls across all agents: bursts (e.g. a large
+# PR fanning out per-hunk calls with gather) otherwise slam straight into
+# provider rate limits, turning into 429 retry stalls that are slower
+# than just queueing locally. Created lazily so it binds the running loop.
+_llm_semaphore: Optional[asyncio.Semaphore] = None
+
+
+def _get_llm_semaphore() -> asyncio.Semaphore:
+    """Return the process-wide LLM concurrency limiter."""
+    global _llm_semaphore
+    if _llm_semaphore is None:
+        _llm_semaphore = asyncio.Semaphore(
+            int(os.environ.get("LLM_MAX_CONCURRENCY", "8"))
+        )
+    return _llm_semaphore
+
+
+def _http_client() -> httpx.AsyncClient:
+    """Build the shared transport with HTTP/2 and keep-alive enabled.
+
+    HTTP/2 requires the optional `h2` package (install `httpx[http2]`);
+    without it the client falls back to HTTP/1.1, which still gets
+    keep-alive connection pooling.
+    """
+    limits = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+    try:
+        return httpx.AsyncClient(http2=True, limits=limits)
+    except ImportError:
+        return httpx.AsyncClient(limits=limits)
+
+
+def _get_openai_client() -> AsyncOpenAI:
+    """Return the process-wide OpenAI client, creating it on first use."""
+    global _openai_client
+    if _openai_client is None:
+        _openai_client = AsyncOpenAI(http_client=_http_client())
+    return _openai_client
+
+
+def _get_anthropic_client():
+    """Return the process-wide Anthropic client, creating it on first use."""
+    global _anthropic_client
+    if _anthropic_client is None:
+        from anthropic import AsyncAnthropic
+        _anthropic_client = AsyncAnthropic(http_client=_http_client())
+    return _anthropic_client
+
+
+def _get_response_cache() -> ResponseCache:
+    """Return the process-wide response cache, creating it on first use."""
+    global _response_cache
+    if _response_cache is None:
+        _response_cache = ResponseCache()
+    return _response_cache
+
+
+class BaseAgent:
+    """Base class for LLM-backed agents.
+
+    Handles conversation state and provider calls for both OpenAI and
+    Anthropic models. The static system prompt is kept byte-identical
+    across calls so provider-side prompt-prefix caching can reuse it:
+    Anthropic gets an explicit `cache_control` breakpoint, OpenAI relies
+    on automatic prefix caching which only matches exact bytes.
+    """
+
+    def __init__(self, name: str, model: str = "gpt-4", system_prompt: str = ""):
+        self.name = name
+        self.model = model
+        self.system_prompt = system_prompt
+        self.reset_conversation()
+
+    def reset_conversation(self):
+        """Clear the conversation history."""
+        self.messages: List[Dict[str, Any]] = []
+
+    def _static_prefix(self) -> str:
+        """Return the normalized system prompt.
+
+        Dedenting and stripping here (rather than at assignment) keeps the
+        prefix deterministic even when subclasses overwrite
+        `self.system_prompt` directly, which is what makes provider-side
+        prefix caching hit on every call.
+        """
+        return textwrap.dedent(self.system_prompt).strip()
+
+    def _is_anthropic_model(self) -> bool:
+        return self.model.startswith("claude")
+
+    async def send_message(self, prompt: str, temperature: float = 0.0,
+                           use_cache: bool = True) -> str:
+        """Send a message to the model and return its reply.
+
+        Args:
+            prompt (str): User message. Callers should keep static
+                instructions at the head and dynamic content (diffs, test
+                output) at the tail so the cacheable prefix stays stable.
+            temperature (float): Sampling temperature
+            use_cache (bool): Whether to serve/store this call through the
+                exact-match response cache. Callers whose prompts embed
+                volatile data (e.g. timestamps in failure output) should
+                pass False.
+
+        Returns:
+            str: The model's reply
+        """
+        # Snapshot the history and build this call's payload locally.
+        # send_message is routinely fanned out with asyncio.gather on one
+        # agent, so mutating self.messages before the await would leak
+        # other in-flight prompts into this call's payload — and once the
+        # fan-out exceeds the semaphore, another prompt would sit *after*
+        # this one, returning the answer to a different hunk.
+        history = list(self.messages)
+        payload = history + [{"role": "user", "content": prompt}]
+
+        # Only exact single-turn calls are cacheable: with history in play
+        # the same prompt can legitimately yield a different answer, and
+        # temperature > 0 makes responses non-deterministic by design.
+        cacheable = use_cache and temperature == 0.0 and not history
+        if cacheable:
+            cache = _get_response_cache()
+            key = ResponseCache.make_key(
+                self.model, self._static_prefix(), prompt
+            )
+            cached = cache.get(key)
+            if cached is not None:
+                self.messages.append({"role": "user", "content": prompt})
+                self.messages.append({"role": "assistant", "content": cached})
+                return cached
+
+        async with _get_llm_semaphore():
+            if self._is_anthropic_model():
+                reply = await self._send_anthropic(payload, temperature)
+            else:
+                reply = await self._send_openai(payload, temperature)
+
+        # Record the exchange only after completion, as an adjacent pair,
+        # so concurrent calls can't interleave a user message between
+        # another call's prompt and reply.
+        self.messages.append({"role": "user", "content": prompt})
+        self.messages.append({"role": "assistant", "content": reply})
+
+        if cacheable:
+            cache.set(key, reply)
+        return reply
+
+    async def stream_message(self, prompt: str, temperature: float = 0.0):
+        """Send a message and yield the reply as text deltas.
+
+        Same conversation semantics as `send_message` (prompt and the full
+        assembled reply are appended to history), but the reply is yielded
+        incrementally as the provider streams it, so callers can surface
+        partial output instead of waiting for the full completion.
+        Streaming bypasses the response cache.
+
+        Args:
+            prompt (str): User message
+            temperature (float): Sampling temperature
+
+        Yields:
+            str: The next chunk of the model's reply
+        """
+        # Per-call payload snapshot, same as send_message: concurrent
+        # streams on one agent must not see each other's pending prompts.
+        payload = list(self.messages) + [{"role": "user", "content": prompt}]
+        chunks: List[str] = []
+
+        # The slot is held for the whole stream: a streaming response
+        # occupies provider capacity until it finishes, same as a blocking
+        # call.
+        async with _get_llm_semaphore():
+            if self._is_anthropic_model():
+                async with _get_anthropic_client().messages.stream(
+                    model=self.model,
+                    max_tokens=4096,
+                    system=[
+                        {
+                            "type": "text",
+                            "text": self._static_prefix(),
+                            "cache_control": {"type": "ephemeral"},
+                        }
+                    ],
+                    messages=payload,
+                    temperature=temperature,
+                ) as stream:
+                    async for text in stream.text_stream:
+                        chunks.append(text)
+                        yield text
+            else:
+                messages = [{"role": "system", "content": self._static_prefix()}]
+                messages.extend(payload)
+                stream = await _get_openai_client().chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    temperature=temperature,
+                    stream=True,
+                )
+                async for chunk in stream:
+                    delta = chunk.choices[0].delta.content
+                    if delta:
+                        chunks.append(delta)
+                        yield delta
+
+        self.messages.append({"role": "user", "content": prompt})
+        self.messages.append({"role": "assistant", "content": "".join(chunks)})
+
+    async def _send_openai(self, payload: List[Dict[str, Any]],
+                           temperature: float) -> str:
+        # System prompt first and byte-identical across calls, dynamic
+        # messages after it, so OpenAI's automatic prefix caching applies.
+        messages = [{"role": "system", "content": self._static_prefix()}]
+        messages.extend(payload)
+
+        response = await _get_openai_client().chat.completions.create(
+            model=self.model,
+            messages=messages,
+            temperature=temperature,
+        )
+        return response.choices[0].message.content
+
+    async def _send_anthropic(self, payload: List[Dict[str, Any]],
+                              temperature: float) -> str:
+        # Mark the static system prompt as a cache breakpoint so the
+        # provider skips re-encoding it on subsequent calls.
+        response = await _get_anthropic_client().messages.create(
+            model=self.model,
+            max_tokens=4096,
+            system=[
+                {
+                    "type": "text",
+                    "text": self._static_prefix(),
+                    "cache_control": {"type": "ephemeral"},
+                }
+            ],
+            messages=payload,
+            temperature=temperature,
+        )
+        return response.content[0].text
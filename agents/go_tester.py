@@ -1,86 +1,130 @@
 # go_tester.py 예시
 import os
+import asyncio
 import subprocess
 import tempfile
 import json
 from typing import Dict, Any
 
 class GoTester:
+    # mockgen 확인 결과 (프로세스 전체에서 공유 — 한 번 확인하면 충분)
+    _mockgen_ready = False
+
     def __init__(self, project_path=None):
         self.project_path = project_path or os.getcwd()
     
-    def run_tests(self, package_path=None, use_mock=True):
-        """Go 테스트 실행
-        
+    async def run_tests(self, package_path=None, use_mock=True, debug=None):
+        """Go 테스트 실행 (이벤트 루프를 막지 않도록 비동기 서브프로세스 사용)
+
         Args:
             package_path: 테스트할 패키지 경로
             use_mock: gomock 사용 여부
-        
+            debug: 상세(-v) 출력 여부 (기본: GO_TEST_DEBUG 환경 변수)
+
         Returns:
             Dict: 테스트 결과
         """
+        if debug is None:
+            debug = os.environ.get("GO_TEST_DEBUG", "").lower() in ("1", "true")
+
         cmd = ["go", "test"]
-        
+
         if use_mock:
-            # gomock이 설치되어 있는지 확인
-            try:
-                subprocess.run(
-                    ["mockgen", "--version"], 
-                    capture_output=True, 
-                    check=True
-                )
-            except (subprocess.CalledProcessError, FileNotFoundError):
-                # gomock 설치
-                subprocess.run(
-                    ["go", "install", "github.com/golang/mock/mockgen@latest"],
-                    check=True
-                )
-        
+            await self._ensure_mockgen()
+
         if package_path:
             cmd.append(package_path)
-        
-        cmd.extend(["-v", "-json"]) # JSON 형식으로 출력
-        
-        # 테스트 실행
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
+
+        # -count=1: 캐시된 결과 대신 항상 새로 실행
+        # -parallel: 테스트 병렬 실행으로 전체 소요 시간 단축
+        # -timeout: 행 걸린 테스트가 워커를 무한정 잡지 않도록
+        cmd.extend([
+            "-count=1",
+            f"-parallel={os.cpu_count() or 4}",
+            "-timeout", os.environ.get("GO_TEST_TIMEOUT", "10m"),
+        ])
+        # -v는 디버그 시에만: 통과한 테스트의 로그까지 출력에 실려
+        # 파싱 비용과 LLM 프롬프트 크기만 키운다
+        if debug:
+            cmd.append("-v")
+        cmd.append("-json") # JSON 형식으로 출력
+
+        # 테스트 실행 (go test가 도는 동안 다른 요청 처리 가능)
+        # stderr를 stdout에 합쳐 스트림 하나만 읽는다 — 별도 드레인
+        # 태스크 없이 빌드 오류도 발생한 순서 그대로 들어온다
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
             cwd=self.project_path
         )
-        
-        # 결과 파싱
-        return self._parse_test_output(result.stdout, result.stderr, result.returncode)
-    
-    def _parse_test_output(self, stdout, stderr, return_code):
-        """테스트 출력 파싱"""
-        results = {
-            "success": return_code == 0,
-            "output": stdout + stderr,
-            "return_code": return_code,
-            "tests": []
-        }
-        
-        # JSON 라인 파싱
-        for line in stdout.splitlines():
+
+        # -json 출력을 한 줄씩 도착하는 대로 파싱 (전체 버퍼링 후
+        # 재스캔하는 대신 스트리밍 처리)
+        tests = []
+        output_lines = []
+        while True:
+            line = await proc.stdout.readline()
+            if not line:
+                break
+            decoded = line.decode()
+            output_lines.append(decoded)
             try:
-                data = json.loads(line)
-                if data.get("Action") == "run" or data.get("Action") == "pass" or data.get("Action") == "fail":
-                    results["tests"].append(data)
+                data = json.loads(decoded)
             except json.JSONDecodeError:
                 continue
-        
+            if data.get("Action") in ("run", "pass", "fail"):
+                tests.append(data)
+
+        await proc.wait()
+
+        return self._build_results(
+            tests, "".join(output_lines), proc.returncode
+        )
+
+    async def _ensure_mockgen(self):
+        """mockgen이 설치되어 있는지 확인하고 없으면 설치 (프로세스당 1회)"""
+        if GoTester._mockgen_ready:
+            return
+
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                "mockgen", "--version",
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+            await proc.communicate()
+            if proc.returncode == 0:
+                GoTester._mockgen_ready = True
+                return
+        except FileNotFoundError:
+            pass
+
+        # gomock 설치
+        install_cmd = ["go", "install", "github.com/golang/mock/mockgen@latest"]
+        proc = await asyncio.create_subprocess_exec(*install_cmd)
+        await proc.wait()
+        if proc.returncode != 0:
+            raise subprocess.CalledProcessError(proc.returncode, install_cmd)
+        GoTester._mockgen_ready = True
+    
+    def _build_results(self, tests, output, return_code):
+        """파싱된 테스트 이벤트로 결과 딕셔너리 구성"""
         # 테스트 통계
-        passed = sum(1 for t in results["tests"] if t.get("Action") == "pass")
-        failed = sum(1 for t in results["tests"] if t.get("Action") == "fail")
-        
-        results["summary"] = {
-            "total": passed + failed,
-            "passed": passed,
-            "failed": failed
+        passed = sum(1 for t in tests if t.get("Action") == "pass")
+        failed = sum(1 for t in tests if t.get("Action") == "fail")
+
+        return {
+            "success": return_code == 0,
+            "output": output,
+            "return_code": return_code,
+            "tests": tests,
+            "summary": {
+                "total": passed + failed,
+                "passed": passed,
+                "failed": failed
+            }
         }
-        
-        return results
     
     def generate_mocks(self, interface_file, package, destination=None):
         """Mock 생성
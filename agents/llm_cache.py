@@ -0,0 +1,65 @@
+import hashlib
+import os
+import sqlite3
+import time
+from typing import Optional
+
+
+class ResponseCache:
+    """Exact-match cache for LLM responses, backed by SQLite.
+
+    Keys are SHA-256 hashes of (model, system prompt, user prompt), so
+    re-running the same analysis on an unchanged diff or re-triggering
+    `/gotest` returns the stored response instead of paying another
+    provider round-trip.
+    """
+
+    def __init__(self, db_path: str = None, ttl: int = 24 * 60 * 60):
+        self.db_path = db_path or os.environ.get(
+            "LLM_CACHE_PATH", os.path.join(os.getcwd(), ".llm_cache.db")
+        )
+        self.ttl = ttl
+        self._conn = sqlite3.connect(self.db_path)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                response TEXT NOT NULL,
+                expires_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(model: str, system_prompt: str, user_prompt: str) -> str:
+        """Build the cache key for a (model, system prompt, user prompt) triple."""
+        raw = f"{model}|{system_prompt}|{user_prompt}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for `key`, or None on miss/expiry."""
+        row = self._conn.execute(
+            "SELECT response, expires_at FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        response, expires_at = row
+        if expires_at < time.time():
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._conn.commit()
+            return None
+        return response
+
+    def set(self, key: str, response: str):
+        """Store `response` under `key` with this cache's TTL."""
+        self._conn.execute(
+            "INSERT OR REPLACE INTO responses (key, response, expires_at) VALUES (?, ?, ?)",
+            (key, response, time.time() + self.ttl),
+        )
+        self._conn.commit()
+
+    def clear(self):
+        """Drop all cached responses."""
+        self._conn.execute("DELETE FROM responses")
+        self._conn.commit()
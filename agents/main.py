@@ -50,12 +50,13 @@ async def run_test_and_notify(data):
     """테스트 실행 및 결과 알림"""
     package_path = data.get("package_path")
     use_mock = data.get("use_mock", True)
-    
+    debug = data.get("debug")
+
     # 테스트 실행
-    results = tester.run_tests(package_path, use_mock)
+    results = await tester.run_tests(package_path, use_mock, debug)
     
-    # Slack으로 결과 전송
-    notifier.send_test_results(results)
+    # Slack으로 결과 전송 (큐에 적재 후 배치 전송)
+    await notifier.send_test_results(results)
 
 if __name__ == "__main__":
     import uvicorn
@@ -1,25 +1,37 @@
 # slack_notifier.py 예시
 import os
-import json
-from slack_sdk import WebClient
+import asyncio
+from slack_sdk.web.async_client import AsyncWebClient
 from slack_sdk.errors import SlackApiError
 
 class SlackNotifier:
-    def __init__(self, token=None, channel=None):
+    def __init__(self, token=None, channel=None, flush_interval=1.0):
         self.token = token or os.environ.get("SLACK_API_TOKEN")
         if not self.token:
             raise ValueError("Slack API 토큰이 필요합니다")
-        
+
         self.channel = channel or os.environ.get("SLACK_CHANNEL", "#go-tests")
-        self.client = WebClient(token=self.token)
-    
-    def send_test_results(self, test_results):
-        """테스트 결과를 Slack으로 전송"""
+        self.client = AsyncWebClient(token=self.token)
+        # 배치 전송: 알림을 큐에 모았다가 flush_interval 동안 들어온 것을
+        # 한 번의 chat_postMessage로 묶어 전송 (rate limit 회피)
+        self.flush_interval = flush_interval
+        self._queue = asyncio.Queue()
+        self._worker = None
+
+    async def send_test_results(self, test_results):
+        """테스트 결과를 큐에 넣고 배치로 Slack에 전송"""
+        text, blocks = self._build_message(test_results)
+        await self._queue.put((text, blocks))
+        self._ensure_worker()
+        return True
+
+    def _build_message(self, test_results):
+        """테스트 결과로 Slack 메시지 (텍스트, 블록) 구성"""
         # 결과 이모지 결정
         emoji = "✅" if test_results.get("success", False) else "❌"
-        
+
         summary = test_results.get("summary", {})
-        
+
         blocks = [
             {
                 "type": "header",
@@ -37,21 +49,21 @@ class SlackNotifier:
                 ]
             }
         ]
-        
+
         # 실패한 테스트 상세 정보 추가
         failed_tests = [t for t in test_results.get("tests", []) if t.get("Action") == "fail"]
         if failed_tests:
             failure_text = "*실패한 테스트:*\n"
-            
+
             for test in failed_tests[:5]:  # 상위 5개만 표시
                 test_name = test.get("Test", "Unknown")
                 output = test.get("Output", "")
-                
+
                 failure_text += f"• `{test_name}`: {output[:100]}{'...' if len(output) > 100 else ''}\n"
-            
+
             if len(failed_tests) > 5:
                 failure_text += f"... 그리고 {len(failed_tests) - 5}개 더 실패"
-            
+
             blocks.append({
                 "type": "section",
                 "text": {
@@ -59,15 +71,108 @@ class SlackNotifier:
                     "text": failure_text
                 }
             })
-        
-        # 메시지 전송
-        try:
-            self.client.chat_postMessage(
-                channel=self.channel,
-                text=f"Go 테스트 결과: {summary.get('passed', 0)}/{summary.get('total', 0)} 통과",
-                blocks=json.dumps(blocks)
-            )
-            return True
-        except SlackApiError as e:
-            print(f"Slack 메시지 전송 오류: {e.response['error']}")
-            return False
\ No newline at end of file
+
+        text = f"Go 테스트 결과: {summary.get('passed', 0)}/{summary.get('total', 0)} 통과"
+        return text, blocks
+
+    def _ensure_worker(self):
+        """배치 전송 워커가 돌고 있는지 확인하고 없으면 시작"""
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.ensure_future(self._flush_loop())
+
+    async def _flush_loop(self):
+        """큐에 쌓인 알림을 모아서 배치로 전송"""
+        while True:
+            text, blocks = await self._queue.get()
+
+            # 같은 구간에 들어온 알림을 모아 한 번에 전송
+            await asyncio.sleep(self.flush_interval)
+
+            texts = [text]
+            merged_blocks = list(blocks)
+            while not self._queue.empty():
+                more_text, more_blocks = self._queue.get_nowait()
+                texts.append(more_text)
+                merged_blocks.append({"type": "divider"})
+                merged_blocks.extend(more_blocks)
+
+            # Slack 메시지당 블록 50개 제한에 맞춰 분할 전송
+            for i in range(0, len(merged_blocks), 50):
+                await self._post_with_retry(
+                    "\n".join(texts), merged_blocks[i:i + 50]
+                )
+
+    async def stream_analysis(self, title, deltas, update_interval=1.0):
+        """LLM 스트리밍 출력을 Slack 메시지에 점진적으로 반영
+
+        초기 메시지를 먼저 올리고, 이후 chat.update로 지금까지 생성된
+        내용을 덧붙인다. 매 청크마다 업데이트하면 바로 rate limit에
+        걸리므로 update_interval 간격으로 스로틀링한다.
+
+        Args:
+            title: 메시지 제목 (예: "테스트 결과 분석")
+            deltas: 텍스트 청크를 내보내는 async iterator
+            update_interval: chat.update 최소 간격 (초)
+
+        Returns:
+            str: 최종 전체 텍스트
+        """
+        response = await self.client.chat_postMessage(
+            channel=self.channel,
+            text=f"{title}\n_생성 중..._"
+        )
+        ts = response["ts"]
+        channel = response["channel"]
+
+        loop = asyncio.get_event_loop()
+        last_update = loop.time()
+        text = ""
+
+        async for delta in deltas:
+            text += delta
+            if loop.time() - last_update >= update_interval:
+                try:
+                    await self.client.chat_update(
+                        channel=channel, ts=ts, text=f"{title}\n{text}"
+                    )
+                except SlackApiError as e:
+                    # rate limit이면 다음 주기로 미루면 되므로 무시
+                    if e.response.status_code != 429:
+                        print(f"Slack 메시지 갱신 오류: {e.response['error']}")
+                last_update = loop.time()
+
+        # 마지막 상태는 재시도까지 해서 반드시 반영
+        for attempt in range(3):
+            try:
+                await self.client.chat_update(
+                    channel=channel, ts=ts, text=f"{title}\n{text}"
+                )
+                break
+            except SlackApiError as e:
+                if e.response.status_code == 429:
+                    await asyncio.sleep(int(e.response.headers.get("Retry-After", 1)))
+                    continue
+                print(f"Slack 메시지 갱신 오류: {e.response['error']}")
+                break
+
+        return text
+
+    async def _post_with_retry(self, text, blocks, max_retries=3):
+        """rate limit(429) 시 Retry-After 만큼 기다렸다가 재시도"""
+        for attempt in range(max_retries + 1):
+            try:
+                # blocks를 리스트 그대로 전달 — slack_sdk가 요청 본문을 만들 때
+                # 한 번만 직렬화하므로 여기서 json.dumps 하면 이중 직렬화가 된다
+                await self.client.chat_postMessage(
+                    channel=self.channel,
+                    text=text,
+                    blocks=blocks
+                )
+                return True
+            except SlackApiError as e:
+                if e.response.status_code == 429 and attempt < max_retries:
+                    retry_after = int(e.response.headers.get("Retry-After", 1))
+                    await asyncio.sleep(retry_after)
+                    continue
+                print(f"Slack 메시지 전송 오류: {e.response['error']}")
+                return False
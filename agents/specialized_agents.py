@@ -0,0 +1,19 @@
+from .base import BaseAgent
+
+
+class RunnerAgent(BaseAgent):
+    """Agent specialized in running tests and analyzing results."""
+
+    def __init__(self, model: str = "gpt-4"):
+        system_prompt = """
+        You are RunnerAgent, an AI specialized in running tests and analyzing results.
+        Your tasks include:
+        1. Setting up test environments
+        2. Executing tests
+        3. Collecting and reporting test results
+        4. Analyzing test failures
+        5. Providing clear, actionable feedback
+
+        Be thorough in your analysis and clear in your reporting.
+        """
+        super().__init__("RunnerAgent", model, system_prompt)